@@ -54,6 +54,29 @@ def is_invalid_gradient(grad: Any) -> bool:
     Returns
     -------
     ``True`` if ``grad`` is invalid"""
+    if isinstance(grad, np.ndarray):
+        return not np.issubdtype(grad.dtype, np.number)
     return not isinstance(grad, (np.ndarray, Real)) or not np.issubdtype(
         np.asarray(grad).dtype, np.number
     )
+
+
+def accumulate_gradient(grad, new_grad):
+    """ Returns ``grad + new_grad``, summed into ``grad`` in-place if it is writeable.
+
+        Parameters
+        ----------
+        grad : numpy.ndarray
+            The gradient accumulated thus far. A read-only gradient (e.g. the
+            seed of a prior back-propagation) is never mutated.
+
+        new_grad : Union[numpy.ndarray, Real]
+
+        Returns
+        -------
+        numpy.ndarray"""
+    if grad.flags.writeable:
+        grad += new_grad
+        return grad
+    # `np.add` returns a numpy-scalar for 0D inputs
+    return np.asarray(np.add(grad, new_grad))
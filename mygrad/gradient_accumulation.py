@@ -0,0 +1,109 @@
+from typing import Dict, List
+
+import numpy as np
+
+from mygrad._utils import accumulate_gradient
+from mygrad.tensor_base import Tensor
+
+__all__ = ["GradientAccumulator"]
+
+
+class GradientAccumulator:
+    """ Accumulates the gradients of a series of micro-batch losses.
+
+    A batch that is too large to pass through a model at once can be split into
+    micro-batches. Each micro-batch's loss is back-propagated, its gradients are
+    summed into the gradients of the tensors that the loss depends on, and its
+    computational graph is cleared so that its intermediate tensors can be
+    garbage collected before the next micro-batch is processed.
+
+    Parameters
+    ----------
+    accum_steps : int
+        The number of micro-batch losses that make up one full batch.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.gradient_accumulation import GradientAccumulator
+    >>> w = mg.Tensor([1.0, 2.0])
+    >>> accumulator = GradientAccumulator(accum_steps=2)
+    >>> for x in ([1.0, 1.0], [2.0, 3.0]):
+    ...     loss = mg.sum(w * x)
+    ...     if accumulator.step(loss):
+    ...         w.data -= 0.1 * w.grad
+    ...         accumulator.null_gradients()
+    >>> w
+    Tensor([0.7, 1.6])"""
+
+    def __init__(self, accum_steps: int):
+        if (
+            not isinstance(accum_steps, int)
+            or isinstance(accum_steps, bool)
+            or accum_steps < 1
+        ):
+            raise ValueError(
+                "`accum_steps` must be a positive integer, got: {}".format(accum_steps)
+            )
+        self.accum_steps = accum_steps
+        self.count = 0
+
+        # the leaf tensors that have received gradients, keyed by id
+        self._leaves = {}  # type: Dict[int, Tensor]
+
+    @property
+    def leaves(self) -> List[Tensor]:
+        """ The non-constant tensors, not produced by an operation, whose
+        gradients are being accumulated.
+
+        Returns
+        -------
+        List[mygrad.Tensor]"""
+        return list(self._leaves.values())
+
+    def step(self, loss: Tensor) -> bool:
+        """ Back-propagates ``loss``, summing its gradients into those of the
+        leaf tensors that it depends on, and clears its computational graph.
+
+        Parameters
+        ----------
+        loss : mygrad.Tensor
+            The loss of one micro-batch.
+
+        Returns
+        -------
+        bool
+            ``True`` if ``accum_steps`` losses have been accumulated since the
+            gradients were last nulled."""
+        # a constant loss does not back-propagate to any tensor
+        if not loss.constant and loss.creator is None:
+            self._leaves[id(loss)] = loss
+        elif not loss.constant:
+            for node in loss._topological_sort():
+                for var in node.creator.variables:
+                    if var.creator is None and not var.constant:
+                        self._leaves[id(var)] = var
+
+        # `Tensor.backward` overwrites, rather than accumulates into, the
+        # gradient of the tensor that it is invoked from
+        loss_grad = loss.grad if loss.creator is None else None
+        loss.backward()
+        if loss_grad is not None:
+            loss.grad = accumulate_gradient(loss_grad, loss.grad)
+
+        for leaf in self._leaves.values():
+            if leaf.grad is not None and not leaf.grad.flags.writeable:
+                # subsequent steps are summed into this buffer in-place
+                leaf.grad = np.array(leaf.grad)
+
+        loss.clear_graph()
+        self.count += 1
+        return self.count % self.accum_steps == 0
+
+    def null_gradients(self):
+        """ Sets the gradient of each accumulated leaf tensor to ``None``,
+        beginning a new accumulation."""
+        for leaf in self._leaves.values():
+            leaf.null_gradients(clear_graph=False)
+        self._leaves.clear()
+        self.count = 0
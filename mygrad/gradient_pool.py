@@ -0,0 +1,179 @@
+from collections import OrderedDict
+from typing import List, Optional
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+__all__ = ["GradientPool"]
+
+
+# the pool that back-propagation currently draws from; pooling is disabled if `None`
+_active_pool = None  # type: Optional[GradientPool]
+
+
+class GradientPool:
+    """ A bounded free-list of gradient buffers, keyed by shape and dtype.
+
+    Training loops that back-propagate through identically-shaped graphs
+    step after step can reuse the gradient buffers of the previous step
+    instead of round-tripping them through the allocator. Pooling is opt-in:
+    back-propagation only draws from a pool while it is active as a context
+    manager.
+
+    Only buffers that the pool allocated itself are recycled, and only when
+    ``Tensor.null_gradients`` releases them. Thus a gradient computed within
+    the context must be copied if it is needed after its tensor's gradients
+    are nulled.
+
+    Parameters
+    ----------
+    max_per_key : int, optional (default=4)
+        The maximum number of buffers retained for any one shape and dtype.
+
+    max_bytes : int, optional (default=2**28)
+        The maximum total size, in bytes, of the retained buffers. The buffers
+        of the least recently used shape and dtype are evicted first.
+
+    Attributes
+    ----------
+    hits : int
+        The number of requests served by a pooled buffer.
+
+    misses : int
+        The number of requests that required a new allocation.
+
+    nbytes : int
+        The total size, in bytes, of the retained buffers.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.gradient_pool import GradientPool
+    >>> x = mg.Tensor([1.0, 2.0, 3.0])
+    >>> with GradientPool() as pool:
+    ...     for _ in range(3):
+    ...         (x + 1).backward()
+    ...         x.null_gradients()
+    >>> pool.hits, pool.misses
+    (2, 1)"""
+
+    def __init__(self, max_per_key=4, max_bytes=2 ** 28):
+        self.max_per_key = max_per_key
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._buffers = OrderedDict()  # type: OrderedDict
+        # the buffers handed out by `get` that have not been returned via `put`
+        self._issued = WeakValueDictionary()  # type: WeakValueDictionary
+        self._previous = []  # type: List[Optional[GradientPool]]
+
+    def __enter__(self):
+        global _active_pool
+        self._previous.append(_active_pool)
+        _active_pool = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active_pool
+        _active_pool = self._previous.pop()
+        self.clear()
+
+    def get(self, shape, dtype):
+        """ Returns an uninitialized, writeable array of the given shape and dtype.
+
+        Parameters
+        ----------
+        shape : Tuple[int, ...]
+        dtype : numpy.dtype
+
+        Returns
+        -------
+        numpy.ndarray"""
+        key = (shape, dtype)
+        buffers = self._buffers.get(key)
+        if buffers:
+            self.hits += 1
+            out = buffers.pop()
+            self.nbytes -= out.nbytes
+            if buffers:
+                self._buffers.move_to_end(key)
+            else:
+                del self._buffers[key]
+        else:
+            self.misses += 1
+            out = np.empty(shape, dtype=dtype)
+        self._issued[id(out)] = out
+        return out
+
+    def put(self, array):
+        """ Retains ``array`` for reuse if it was handed out by this pool and
+        there is room for it.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+
+        Returns
+        -------
+        bool
+            ``True`` if ``array`` was retained."""
+        if self._issued.get(id(array)) is not array:
+            return False
+        del self._issued[id(array)]
+
+        if array.nbytes > self.max_bytes:
+            return False
+
+        key = (array.shape, array.dtype)
+        buffers = self._buffers.setdefault(key, [])
+        self._buffers.move_to_end(key)
+        if len(buffers) >= self.max_per_key:
+            return False
+
+        # evict the least recently used buffers until `array` fits
+        while self.nbytes + array.nbytes > self.max_bytes:
+            lru_key = next(iter(self._buffers))
+            lru_buffers = self._buffers[lru_key]
+            if lru_buffers:
+                self.nbytes -= lru_buffers.pop().nbytes
+            if not lru_buffers and lru_key != key:
+                del self._buffers[lru_key]
+
+        buffers.append(array)
+        self.nbytes += array.nbytes
+        return True
+
+    def clear(self):
+        """ Releases all of the retained buffers."""
+        self._buffers.clear()
+        self._issued.clear()
+        self.nbytes = 0
+
+
+def copy_gradient(grad):
+    """ Returns a copy of ``grad``, drawn from the active gradient pool if
+    there is one.
+
+    Parameters
+    ----------
+    grad : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray"""
+    if _active_pool is None:
+        return np.copy(grad)
+    out = _active_pool.get(grad.shape, grad.dtype)
+    np.copyto(out, grad)
+    return out
+
+
+def release_gradient(grad):
+    """ Returns ``grad`` to the active gradient pool, if it was drawn from it.
+
+    Parameters
+    ----------
+    grad : numpy.ndarray"""
+    if _active_pool is not None:
+        _active_pool.put(grad)
@@ -6,7 +6,7 @@ from itertools import chain
 import numpy as np
 from numpy.lib.stride_tricks import as_strided
 
-from mygrad._utils import reduce_broadcast
+from mygrad._utils import accumulate_gradient, reduce_broadcast
 from mygrad.operation_base import BroadcastableOp
 
 __all__ = ["MatMul", "EinSum"]
@@ -279,7 +279,7 @@ class EinSum(BroadcastableOp):
             dfdx *= factor
         return dfdx
 
-    def backward(self, grad, *, graph, **kwargs):
+    def backward(self, grad, **kwargs):
         """ Back-propagates the gradient through all of the operation's inputs.
             Constant tensors do not propagate a gradient.
 
@@ -291,11 +291,9 @@ class EinSum(BroadcastableOp):
             ----------
             grad : numpy.ndarray
                 The back-propagated total derivative with respect to the present
-                operation (`f`): d(out)/df
-
-            graph : Set[Operation]"""
+                operation (`f`): d(out)/df"""
         for index, var in enumerate(self.variables):
-            if not var.constant:
+            if not var._constant:
                 if not var._ops:
                     raise Exception(
                         "Invalid Backprop: part of the computational graph containing "
@@ -313,10 +311,5 @@ class EinSum(BroadcastableOp):
                 else:
                     o = self.backward_var(grad, index, **kwargs)
                     if o is not None:
-                        var.grad += reduce_broadcast(o, var.shape)
-
-        for var in {
-            i for i in self.variables if not i.constant and i.creator is not None
-        }:
-            var._accum_ops.add(self)
-            var._backward(graph=graph)
+                        o = reduce_broadcast(o, var.shape)
+                        var.grad = accumulate_gradient(var.grad, o)
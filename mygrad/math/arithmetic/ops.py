@@ -1,5 +1,3 @@
-from functools import reduce
-
 import numpy as np
 
 from mygrad.operation_base import BroadcastableOp, Operation
@@ -19,6 +17,35 @@ __all__ = [
 ]
 
 
+def _reduce_into(ufunc, arrays):
+    """ Reduces a sequence of arrays via a binary ufunc: f(f(a, b), c), ...
+
+        Rather than creating an intermediate array for each step of the
+        reduction, the result is accumulated into a single buffer wherever
+        broadcasting and type-promotion permit.
+
+        Parameters
+        ----------
+        ufunc : numpy.ufunc
+        arrays : Sequence[numpy.ndarray]
+            At least two arrays.
+
+        Returns
+        -------
+        numpy.ndarray"""
+    out = ufunc(arrays[0], arrays[1])
+    for arr in arrays[2:]:
+        if (
+            isinstance(out, np.ndarray)
+            and np.result_type(out, arr) == out.dtype
+            and np.broadcast(out, arr).shape == out.shape
+        ):
+            ufunc(out, arr, out=out)
+        else:
+            out = ufunc(out, arr)
+    return out
+
+
 class Add(BroadcastableOp):
     def __call__(self, a, b):
         """ Performs 'add' forward-pass: f(a,b) -> a + b
@@ -93,7 +120,13 @@ class Divide(BroadcastableOp):
         if index == 0:  # backprop through a
             return grad / b.data
         else:  # broadcast through b
-            return -grad * a.data / (b.data ** 2)
+            # -grad * a / b ** 2, computed in a single buffer; the buffer must
+            # hold the dtype that the full expression would promote to
+            out = np.divide(grad, b.data, dtype=np.result_type(grad, a.data, b.data))
+            out *= a.data
+            out /= b.data
+            out *= -1
+            return out
 
 
 class Reciprocal(BroadcastableOp):
@@ -154,11 +187,11 @@ class Positive(Operation):
                 Values of True indicate to calculate the ufunc at that position,
                 values of False indicate to leave the value in the output alone."""
         self.variables = (a,)
-        self.conf = dict(where=where)
+        self.where = where
         return np.positive(a.data, where=where)
 
     def backward_var(self, grad, index, **kwargs):
-        return np.positive(grad, **self.conf)
+        return np.positive(grad, where=self.where)
 
 
 class Negative(Operation):
@@ -173,11 +206,11 @@ class Negative(Operation):
                 Values of True indicate to calculate the ufunc at that position,
                 values of False indicate to leave the value in the output alone."""
         self.variables = (a,)
-        self.conf = dict(where=where)
+        self.where = where
         return np.negative(a.data, where=where)
 
     def backward_var(self, grad, index, **kwargs):
-        return np.negative(grad, **self.conf)
+        return np.negative(grad, where=self.where)
 
 
 class AddSequence(BroadcastableOp):
@@ -186,7 +219,7 @@ class AddSequence(BroadcastableOp):
     def __call__(self, *input_vars):
         assert len(input_vars) > 1, "`add_sequence` requires at least two operands"
         self.variables = input_vars
-        out = sum(var.data for var in input_vars)
+        out = _reduce_into(np.add, [var.data for var in input_vars])
         return out
 
     def backward_var(self, grad, index, **kwargs):
@@ -199,27 +232,27 @@ class MultiplySequence(BroadcastableOp):
     def __call__(self, *input_vars):
         assert len(input_vars) > 1, "`multiply_sequence` requires at least two operands"
         self.variables = input_vars
-        out = reduce(lambda x, y: x * y, (var.data for var in input_vars))
+        out = _reduce_into(np.multiply, [var.data for var in input_vars])
         self._iszero = np.any(out == 0)
         return out
 
-    def backward(self, grad, *, graph, **kwargs):
+    def backward(self, grad, **kwargs):
         """ Back-propagates the gradient through all of the operation's inputs. This needs to be updated
             by an operation if that operation takes more than 2 Tensor arguments."""
         if not self._iszero:
-            self._product = grad * reduce(
-                lambda x, y: x * y, (var.data for n, var in enumerate(self.variables))
+            # recomputed from the inputs: the output's data may since have been
+            # written to
+            self._product = _reduce_into(
+                np.multiply, [grad] + [var.data for var in self.variables]
             )
         else:
             self._product = None
-        super().backward(grad, graph=graph, **kwargs)
+        super().backward(grad, **kwargs)
 
     def backward_var(self, grad, index, **kwargs):
         var = self.variables[index]
         if not self._iszero:
             return self._product / var.data
         else:
-            return grad * reduce(
-                lambda x, y: x * y,
-                (var.data for n, var in enumerate(self.variables) if n != index),
-            )
+            others = [var.data for n, var in enumerate(self.variables) if n != index]
+            return _reduce_into(np.multiply, [grad] + others)
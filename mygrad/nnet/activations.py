@@ -54,7 +54,7 @@ def sigmoid(x, constant=False):
 class ReLu(Operation):
     def __call__(self, a):
         self.variables = (a,)
-        self.back = np.asarray(a > 0, dtype=a.dtype)
+        self.back = np.asarray(a.data > 0, dtype=a.dtype)
         return a.data * self.back
 
     def backward_var(self, grad, index, **kwargs):
@@ -2,6 +2,7 @@ from numbers import Integral
 
 import numpy as np
 
+from mygrad._utils import accumulate_gradient
 from mygrad.operation_base import Operation
 from mygrad.tensor_base import Tensor
 
@@ -162,7 +163,7 @@ def _backprop(var, grad):
         if var.grad is None:
             var.grad = np.asarray(grad)
         else:
-            var.grad += grad
+            var.grad = accumulate_gradient(var.grad, grad)
 
 
 class GRUnit(Operation):
@@ -258,7 +259,7 @@ class GRUnit(Operation):
 
         return self._hidden_seq
 
-    def backward(self, grad, *, graph, **kwargs):
+    def backward(self, grad, **kwargs):
         if all(
             i.constant
             for i in [
@@ -281,7 +282,8 @@ class GRUnit(Operation):
         r = self._r.data
         h = self._h.data
 
-        dLds = grad[1:]
+        # `_gru_bptt` accumulates into `dLds` in-place
+        dLds = np.copy(grad[1:])
 
         const = {"1 - h**2": d_tanh(h), "z*(1 - z)": d_sig(z), "r*(1 - r)": d_sig(r)}
 
@@ -404,22 +406,6 @@ class GRUnit(Operation):
         del self._r
         del self._h
 
-        for x in (
-            self.X,
-            self.Uz,
-            self.Wz,
-            self.bz,
-            self.Ur,
-            self.Wr,
-            self.br,
-            self.Uh,
-            self.Wh,
-            self.bh,
-        ):
-            if not x.constant:
-                x._accum_ops.add(self)
-                x._backward(graph=graph)
-
 
 def gru(
     X,
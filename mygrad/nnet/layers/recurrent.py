@@ -2,6 +2,7 @@ from numbers import Integral
 
 import numpy as np
 
+from mygrad._utils import accumulate_gradient
 from mygrad.operation_base import Operation
 from mygrad.tensor_base import Tensor
 
@@ -62,7 +63,7 @@ def _backprop(var, grad):
         if var.grad is None:
             var.grad = np.asarray(grad)
         else:
-            var.grad += grad
+            var.grad = accumulate_gradient(var.grad, grad)
 
 
 class RecurrentUnit(Operation):
@@ -132,7 +133,7 @@ class RecurrentUnit(Operation):
 
         return self._hidden_seq.data
 
-    def backward(self, grad, *, graph, **kwargs):
+    def backward(self, grad, **kwargs):
         """ Performs back propagation through time (with optional truncation), using the
             following notation:
 
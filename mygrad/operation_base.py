@@ -2,12 +2,13 @@
 Defines the base class for mathematical operations capable of back-propagating
 gradients to their input tensors."""
 
-from typing import Optional, Set
+from typing import Set
 
 import numpy as np
 
-from mygrad._utils import is_invalid_gradient, reduce_broadcast
+from mygrad._utils import accumulate_gradient, is_invalid_gradient, reduce_broadcast
 from mygrad.errors import InvalidBackprop, InvalidGradient
+from mygrad.gradient_pool import copy_gradient
 
 __all__ = ["Operation", "BroadcastableOp"]
 
@@ -43,9 +44,27 @@ class Operation:
     # requires that backpropagation be invoked from a scalar
     scalar_only = False  # type: bool
 
-    # stores a set of all the operation-instances that participate in
-    # the computational graph up to and including the present operation
-    graph = None  # type: Optional[Set[Operation]]
+    @property
+    def graph(self):
+        """ The set of all the operation-instances that participate in
+        the computational graph up to and including the present operation.
+
+        The set is assembled on demand by walking the input tensors of each
+        operation; operations do not each store a copy of their ancestry.
+
+        Returns
+        -------
+        Set[Operation]"""
+        graph = {self}  # type: Set[Operation]
+        stack = [self]
+        while stack:
+            op = stack.pop()
+            for var in getattr(op, "variables", ()):
+                creator = var._creator
+                if not var._constant and creator is not None and creator not in graph:
+                    graph.add(creator)
+                    stack.append(creator)
+        return graph
 
     def __call__(self, *input_vars, **kwargs):
         """ Performs a forward pass, f, of this Operation::
@@ -93,7 +112,7 @@ class Operation:
         NotImplemented Error"""
         raise NotImplementedError
 
-    def backward(self, grad, *, graph, _reduction=None, **kwargs):
+    def backward(self, grad, *, _reduction=None, **kwargs):
         """ Back-propagates the gradient through all of the operation's inputs.
         Constant tensors do not propagate a gradient.
 
@@ -103,16 +122,12 @@ class Operation:
             The back-propagated total derivative with respect to the present
             operation (`f`): d(out)/df
 
-        graph : Set[Operation]
-            The set of all operations relevant to the terminal node of the computational graph,
-            which triggered back-propagation.
-
         _reduction : Optional[Callable[[ndarray, Tuple[int, ...]], ndarray]]
             Developer option-only. A callable used to process the gradient
             prior to accumulation (e.g. broadcast-reduction)
         """
         for index, var in enumerate(self.variables):
-            if not var.constant:
+            if not var._constant:
                 if not var._ops:
                     raise InvalidBackprop(
                         "Part of the computational graph containing "
@@ -133,30 +148,30 @@ class Operation:
                         )
                     )
                 if var.grad is None:
-                    tmp_grad = np.asarray(backed_grad)
+                    tmp_grad = (
+                        backed_grad
+                        if type(backed_grad) is np.ndarray
+                        or isinstance(backed_grad, np.ndarray)
+                        else np.asarray(backed_grad)
+                    )
 
                     if _reduction is not None:
-                        tmp_grad = _reduction(tmp_grad, var.shape)
+                        tmp_grad = _reduction(tmp_grad, var.data.shape)
 
                     var.grad = (
-                        np.copy(tmp_grad)
+                        copy_gradient(tmp_grad)
                         if np.shares_memory(tmp_grad, grad)
                         else tmp_grad
                     )
                 else:
-                    if _reduction is None:
-                        var.grad += backed_grad
-                    else:
-                        var.grad += _reduction(backed_grad, var.shape)
-        for var in {
-            i for i in self.variables if not i.constant and i.creator is not None
-        }:
-            var._accum_ops.add(self)
-            var._backward(graph=graph)
+                    if _reduction is not None:
+                        backed_grad = _reduction(backed_grad, var.data.shape)
+
+                    var.grad = accumulate_gradient(var.grad, backed_grad)
 
 
 class BroadcastableOp(Operation):
     """ Signals that an Operation's forward pass can broadcast its tensor arguments."""
 
-    def backward(self, grad, *, graph, _reduction=None, **kwargs):
-        return super().backward(grad, graph=graph, _reduction=reduce_broadcast)
+    def backward(self, grad, *, _reduction=None, **kwargs):
+        return super().backward(grad, _reduction=reduce_broadcast)
@@ -5,12 +5,13 @@ etc., are bound to the Tensor class in ``mygrad.__init__.py``.
 """
 
 from functools import wraps
-from typing import List, Set, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 import numpy as np
 
 from mygrad._utils import is_invalid_gradient
 from mygrad.errors import InvalidGradient, InvalidBackprop
+from mygrad.gradient_pool import release_gradient
 from mygrad.linalg.ops import MatMul
 from mygrad.math.arithmetic.ops import *
 from mygrad.operation_base import BroadcastableOp, Operation
@@ -102,8 +103,23 @@ class Tensor:
     array will not be tracked by any computational graph involving that tensor, thus
     back-propagation through that tensor will likely be incorrect."""
 
+    __slots__ = (
+        "data",
+        "grad",
+        "_constant",
+        "_scalar_only",
+        "_creator",
+        "_ops",
+        "__weakref__",
+    )
+
     __array_priority__ = 15.0
 
+    # The comparison operators, including `__eq__`, are elementwise (see the end of
+    # this module); tensors are nonetheless hashed by identity so that they can be
+    # stored in sets and used as dictionary keys
+    __hash__ = object.__hash__
+
     def __init__(
         self, x, *, dtype=None, constant=False, _scalar_only=False, _creator=None
     ):
@@ -135,7 +151,11 @@ class Tensor:
         self._scalar_only = _scalar_only
         self._creator = _creator
 
-        if isinstance(x, Tensor):
+        if type(x) is np.ndarray and dtype is None:
+            # skip the `asarray` call for the common case of being handed an array
+            self.data = x  # type: np.ndarray
+            self._check_valid_dtype(x.dtype)
+        elif type(x) is Tensor or isinstance(x, Tensor):
             self.data = x.data
         else:
             self.data = np.asarray(x, dtype=dtype)
@@ -147,9 +167,6 @@ class Tensor:
         # track all operations that this tensor participates in
         self._ops = set()  # type: Set[Operation]
 
-        # track the operations that have contributed to this tensor's gradient during a back-prop
-        self._accum_ops = set()  # type: Set[Operation]
-
     @staticmethod
     def _check_valid_dtype(dtype):
         if not np.issubdtype(dtype, np.number):
@@ -161,11 +178,11 @@ class Tensor:
     def _op(
         cls,
         Op: Type[Operation],
-        *input_vars,
-        op_args=None,
-        op_kwargs=None,
-        constant=False
-    ):
+        *input_vars: Any,
+        op_args: Optional[Tuple[Any, ...]] = None,
+        op_kwargs: Optional[Dict[str, Any]] = None,
+        constant: bool = False
+    ) -> "Tensor":
         """ Wraps operations performed between tensors: f(a, b, ...).
 
         Parameters
@@ -192,50 +209,45 @@ class Tensor:
         mygrad.Tensor
             The tensor-result of the operation's forward-pass."""
 
-        if op_args is None:
-            op_args = tuple()
-
-        if op_kwargs is None:
-            op_kwargs = dict()
+        f = Op()
 
+        # a single pass over the inputs collects everything needed from them
+        # (underscored attributes are accessed to bypass property dispatch)
         tensor_vars = []  # type: List[Tensor]
+        variable_vars = []  # type: List[Tensor]
+        scalar_only = False
         for var in input_vars:
-            if not isinstance(var, cls):
+            # `type(...) is` short-circuits the MRO walk of `isinstance`
+            if type(var) is not cls and not isinstance(var, cls):
                 var = cls(var, constant=True)
             tensor_vars.append(var)
 
-        is_const = constant or all(var.constant for var in tensor_vars)
+            if not var._constant:
+                variable_vars.append(var)
+                scalar_only = scalar_only or var._scalar_only
 
-        f = Op()
-        f.graph = {f}
-        f.graph.update(
-            *(
-                var._creator.graph
-                for var in tensor_vars
-                if var._creator is not None and not var.constant
-            )
-        )
-        op_out = f(*tensor_vars, *op_args, **op_kwargs)
+        is_const = constant or not variable_vars
+
+        if op_args is None and op_kwargs is None:
+            # the common case: don't build empty argument-containers to unpack
+            op_out = f(*tensor_vars)
+        else:
+            op_out = f(*tensor_vars, *(op_args or ()), **(op_kwargs or {}))
 
         if isinstance(f, BroadcastableOp) and not f.scalar_only:
             # if broadcasting occurred: scalar-only -> True
-            f.scalar_only = any(
-                op_out.shape != i.shape for i in tensor_vars if not i.constant
-            )
+            f.scalar_only = any(op_out.shape != i.data.shape for i in variable_vars)
 
         if not is_const:
             # record that a variable participated in that op
-            for var in tensor_vars:
-                if not var.constant:
-                    var._ops.add(f)
+            for var in variable_vars:
+                var._ops.add(f)
 
-        scalar_only = f.scalar_only and not is_const
-        for var in tensor_vars:
-            scalar_only = scalar_only or (var.scalar_only and not var.constant)
+        scalar_only = scalar_only or (f.scalar_only and not is_const)
 
         return cls(op_out, constant=is_const, _creator=f, _scalar_only=scalar_only)
 
-    def backward(self, grad=None):
+    def backward(self, grad: Any = None) -> None:
         """ Compute set or accumulate ``self.grad`` with `grad`, and pass ``self.creator.backward(grad)``.
         In effect, calling ``self.backward()`` will trigger a "back-propagation" from ``self`` through
         the preceding nodes in the computational graph. Thus a node, ``a``, will have the attribute
@@ -245,7 +257,8 @@ class Tensor:
         ----------
         grad : Optional[array_like]
             The value of the incoming derivative. If self.grad is None, it is set to `grad`,
-            otherwise its value is added with `grad`.
+            otherwise its value is added with `grad`. If `None`, ``self.grad`` is seeded with
+            a read-only array of ones.
 
         Raises
         ------
@@ -275,7 +288,17 @@ class Tensor:
             return
 
         if grad is not None:
-            self.grad = np.asarray(grad.data if isinstance(grad, Tensor) else grad)
+            _grad = (
+                grad.data if type(grad) is Tensor or isinstance(grad, Tensor) else grad
+            )
+            if type(_grad) is np.ndarray or isinstance(_grad, np.ndarray):
+                # `self.grad` can later be accumulated into in-place; a read-only
+                # view protects the caller's array without copying it. Array
+                # subclasses (e.g. `np.matrix`) are viewed as plain arrays
+                self.grad = _grad.view(np.ndarray)
+                self.grad.flags.writeable = False
+            else:
+                self.grad = np.asarray(_grad)
             if is_invalid_gradient(self.grad):
                 raise InvalidGradient(
                     "An invalid gradient-value was passed to "
@@ -290,51 +313,86 @@ class Tensor:
                 )
 
         else:
-            if self.ndim > 0 and self._scalar_only:
+            data = self.data
+            if data.ndim > 0 and self._scalar_only:
                 raise InvalidBackprop(
                     "Backpropagation must be invoked from a "
                     "scalar-tensor (a 0D tensor) for this computational "
                     "graph."
                 )
-            dtype = float if np.issubdtype(self.dtype, np.signedinteger) else self.dtype
-            self.grad = (
-                np.ones(self.shape, dtype=dtype)
-                if self.ndim > 0
-                else np.asarray(1.0, dtype=dtype)
-            )
+            dtype = float if np.issubdtype(data.dtype, np.signedinteger) else data.dtype
+            # The seed is a read-only, stride-0 view of a single 1; no memory is
+            # allocated for a seed the size of `self`
+            self.grad = np.broadcast_to(np.ones((), dtype=dtype), data.shape)
+
+        if self._creator is not None:
+            # each tensor is reached only after all of the tensors that it
+            # feeds into have back-propagated to it
+            for node in reversed(self._topological_sort()):
+                node._backward()
+
+    def _topological_sort(self) -> List["Tensor"]:
+        """
+        **For dev-use only**
 
-        if self.creator is not None:
-            self._backward(graph=self.creator.graph)
+        Returns the non-constant tensors that precede (and include) ``self`` in its
+        computational graph, and which were produced by an operation. Each tensor
+        is listed after all of the tensors that it depends on.
 
-    def _backward(self, *, graph):
+        The graph is traversed iteratively, thus arbitrarily deep computational
+        graphs do not exhaust the interpreter's recursion limit.
+
+        Returns
+        -------
+        List[Tensor]
+        """
+        order = []  # type: List[Tensor]
+        visited = set()  # type: Set[int]
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                # all of `node`'s dependencies have been recorded
+                order.append(node)
+                continue
+
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+
+            stack.append((node, True))
+            for var in node._creator.variables:
+                if (
+                    not var._constant
+                    and var._creator is not None
+                    and id(var) not in visited
+                ):
+                    stack.append((var, False))
+        return order
+
+    def _backward(self):
         """
         **For dev-use only**
 
-        If `self` has accumulated incoming gradients from all operations in the terminal node's
-        computational graph, back-propagate the accumulated gradient to the creator of `self`.
+        Back-propagate the accumulated gradient of `self` to the creator of `self`.
 
-        Parameters
-        ----------
-        graph : Set[Operation]
-            The set of all operations relevant to the terminal node of the computational graph,
-            which triggered back-propagation
+        ``Tensor.backward`` invokes this on each node of the computational graph
+        in reverse-topological order, thus `self` has received all of its incoming
+        gradients by the time this is called.
 
         Raises
         ------
         AssertionError
             Raises if the tensor and its associated gradient possess different shapes.
         """
-        if self._constant:
+        if self._constant or self.grad is None:
             return
 
         assert (
-            self.grad.shape == self.shape
+            self.grad.shape == self.data.shape
         ), "A tensor and its associated gradient must possess the same shape"
-        if self._creator is not None and not bool(
-            graph & (self._ops - self._accum_ops)
-        ):
-            self._accum_ops.clear()
-            self._creator.backward(self.grad, graph=graph)
+        if self._creator is not None:
+            self._creator.backward(self.grad)
 
     def null_gradients(self, clear_graph=True):
         """
@@ -356,6 +414,9 @@ class Tensor:
         all intermediate operations and tensors in the computational graph and thus permits
         garbage collection - freeing the memory that was used by the computational graph.
 
+        While a ``mygrad.gradient_pool.GradientPool`` is active, a nulled gradient
+        that was drawn from the pool is returned to it for reuse.
+
         Examples
         --------
         >>> import mygrad as mg
@@ -372,7 +433,10 @@ class Tensor:
         True
         """
 
+        if self.grad is not None:
+            release_gradient(self.grad)
         self.grad = None
+
         if self._creator is None:
             return
         for var in self._creator.variables:
@@ -487,16 +551,16 @@ class Tensor:
         """
         return self._creator
 
-    def __len__(self):
+    def __len__(self) -> int:
         return len(self.data)
 
-    def __contains__(self, item):
+    def __contains__(self, item: Any) -> bool:
         return self.data.__contains__(item)
 
-    def __getitem__(self, item):
+    def __getitem__(self, item: Any) -> "Tensor":
         return self._op(GetItem, self, op_args=(item,))
 
-    def __setitem__(self, key, value):
+    def __setitem__(self, key: Any, value: Any) -> None:
         if self.constant and (not isinstance(value, Tensor) or value.constant):
             self.data[key] = value.data if isinstance(value, Tensor) else value
             return None
@@ -509,7 +573,6 @@ class Tensor:
             _creator=self.creator,
         )
         old_tensor._ops = self._ops
-        old_tensor._accum_ops = self._accum_ops
 
         # point all ops involving `self` to old_tensor instead
         for op in old_tensor._ops:
@@ -524,56 +587,57 @@ class Tensor:
         self._creator = out.creator
         self._scalar_only = out._scalar_only
         self._ops = out._ops
-        self._accum_ops = out._accum_ops
         self.data = out.data
         self._constant = out.constant
 
-    def __add__(self, other):
+    def __add__(self, other: Any) -> "Tensor":
         return self._op(Add, self, other)
 
-    def __radd__(self, other):
+    def __radd__(self, other: Any) -> "Tensor":
         return self._op(Add, other, self)
 
-    def __sub__(self, other):
+    def __sub__(self, other: Any) -> "Tensor":
         return self._op(Subtract, self, other)
 
-    def __rsub__(self, other):
+    def __rsub__(self, other: Any) -> "Tensor":
         return self._op(Subtract, other, self)
 
-    def __truediv__(self, other):
+    def __truediv__(self, other: Any) -> "Tensor":
         return self._op(Divide, self, other)
 
-    def __rtruediv__(self, other):
+    def __rtruediv__(self, other: Any) -> "Tensor":
         return self._op(Divide, other, self)
 
-    def __mul__(self, other):
+    def __mul__(self, other: Any) -> "Tensor":
         return self._op(Multiply, self, other)
 
-    def __rmul__(self, other):
+    def __rmul__(self, other: Any) -> "Tensor":
         return self._op(Multiply, other, self)
 
-    def __matmul__(self, other):
+    def __matmul__(self, other: Any) -> "Tensor":
         return self._op(MatMul, self, other)
 
-    def __rmatmul__(self, other):
+    def __rmatmul__(self, other: Any) -> "Tensor":
         return self._op(MatMul, other, self)
 
-    def __pow__(self, other):
+    def __pow__(self, other: Any) -> "Tensor":
         return self._op(Power, self, other)
 
-    def __rpow__(self, other):
+    def __rpow__(self, other: Any) -> "Tensor":
         return self._op(Power, other, self)
 
-    def __neg__(self):
+    def __neg__(self) -> "Tensor":
         return self._op(Negative, self)
 
-    def __pos__(self):
+    def __pos__(self) -> "Tensor":
         return self
 
-    def __repr__(self):
-        return repr(self.data).replace("array", "Tensor").replace("\n", "\n ")
+    def __repr__(self) -> str:
+        # numpy's repr always leads with "array"; "Tensor" is one character
+        # longer, so wrapped lines are indented by one more space
+        return "Tensor" + repr(self.data)[5:].replace("\n", "\n ")
 
-    def __copy__(self):
+    def __copy__(self) -> "Tensor":
         """ Produces a copy of ``self`` with ``copy.creator=None``.
 
         Copies of the underlying numpy data array and gradient array are created.
@@ -635,17 +699,17 @@ class Tensor:
         22.2
         >>> type(x.item())
         float """
-        if self.size > 1:
+        if self.data.size > 1:
             raise ValueError("can only convert a tensor of size 1 to a Python scalar")
         return self.data.item()
 
-    def __float__(self):
-        if self.size > 1:
+    def __float__(self) -> float:
+        if self.data.size > 1:
             raise TypeError("can only convert a tensor of size 1 to a Python scalar")
         return float(self.data)
 
-    def __int__(self):
-        if self.size > 1:
+    def __int__(self) -> int:
+        if self.data.size > 1:
             raise TypeError("can only convert a tensor of size 1 to a Python scalar")
         return int(self.data)
 
@@ -794,8 +858,10 @@ class Tensor:
 # set all comparison operators - mirrors ndarray methods
 def tensor_to_array_wrapper(func):
     @wraps(func)
-    def wrapped(x, y):
-        return func(x.data, y.data if isinstance(y, Tensor) else y)
+    def wrapped(x: Tensor, y: Any) -> Union[bool, np.ndarray]:
+        if type(y) is Tensor or isinstance(y, Tensor):
+            y = y.data
+        return func(x.data, y)
 
     return wrapped
 
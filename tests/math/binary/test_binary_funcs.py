@@ -66,6 +66,31 @@ def test_divide_bkwd():
     pass
 
 
+def test_divide_bkwd_0d():
+    """ regression test: the gradient for 0D tensors is a numpy-scalar"""
+    x = Tensor(3.0)
+    y = Tensor(2.0)
+
+    o = divide(x, y)
+    o.backward()
+
+    assert_allclose(x.grad, 0.5)
+    assert_allclose(y.grad, -0.75)
+
+
+def test_divide_bkwd_mixed_dtypes():
+    """ regression test: the gradient for `b` is not computed in a narrower
+    dtype than that of `-grad * a / b ** 2`"""
+    x = Tensor(np.array([1e200, 2.0]))
+    y = Tensor(np.array([2.0, 4.0], dtype="float32"))
+
+    o = divide(x, y)
+    o.backward(np.ones(2, dtype="float32"))
+
+    assert y.grad.dtype == np.float64
+    assert_allclose(y.grad, [-2.5e199, -0.125])
+
+
 @fwdprop_test_factory(
     mygrad_func=power,
     true_func=np.power,
@@ -347,3 +347,25 @@ def test_gru_backward(data):
     ls2.null_gradients()
     for x in [s, Wz, Wr, Wh, bz, br, bh, X, Uz, Ur, Uh, V]:
         assert x.grad is None
+
+
+def test_gru_backward_from_provided_grad():
+    rng = np.random.RandomState(0)
+    T, N, C, D = 3, 2, 4, 3
+    X = Tensor(rng.rand(T, N, C))
+    params = [
+        Tensor(rng.rand(*shape))
+        for shape in [(C, D), (D, D), (D,), (C, D), (D, D), (D,), (C, D), (D, D), (D,)]
+    ]
+
+    s = gru(X, *params)
+    grad = np.ones(s.shape)
+    s.backward(grad)
+    assert_allclose(grad, np.ones(s.shape))  # the caller's array is not mutated
+    grads = [p.grad for p in [X] + params]
+
+    for p in [X] + params:
+        p.null_gradients()
+    gru(X, *params).sum().backward()
+    for actual, expected in zip(grads, (p.grad for p in [X] + params)):
+        assert_allclose(actual, expected)
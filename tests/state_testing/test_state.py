@@ -127,7 +127,6 @@ class GraphCompare(RuleBasedStateMachine):
                 assert_almost_equal(
                     desired=n.grad, actual=t.grad, err_msg=_node_ID_str(num)
                 )
-            assert not t._accum_ops, _node_ID_str(num)
 
 
 TestGraphComparison = GraphCompare.TestCase
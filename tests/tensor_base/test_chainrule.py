@@ -64,3 +64,26 @@ def test_non_broadcastable(data, grad):
     assert_allclose(actual=v3.grad, desired=grad)
     assert_allclose(actual=v2.grad, desired=-np.sin(v2.data) * grad)
     assert_allclose(actual=v1.grad, desired=np.exp(v1.data) * -np.sin(v2.data) * grad)
+
+
+def test_diamond_graph():
+    x = Tensor(1.0)
+    y = x
+    for _ in range(40):
+        # each node feeds into its successor twice
+        y = y + y
+
+    y.backward()
+    assert_allclose(x.grad, 2.0 ** 40)
+
+
+def test_deep_graph_does_not_recurse():
+    import sys
+
+    x = Tensor(1.0)
+    y = x
+    for _ in range(2 * sys.getrecursionlimit()):
+        y = y + 1
+
+    y.backward()
+    assert_allclose(x.grad, 1.0)
@@ -1,3 +1,5 @@
+from numpy.testing import assert_array_equal
+
 import mygrad as mg
 from mygrad.math.arithmetic.ops import Add, Power, Divide
 
@@ -26,3 +28,32 @@ def test_op_tracks_graph():
     assert all(
         isinstance(x, (Add, Power, Divide)) for x in i.creator.graph - h.creator.graph
     )
+
+
+def test_constant_branch_is_not_traversed():
+    """Ensures that back-propagation does not visit the subgraph preceding a
+    constant tensor"""
+    x = mg.Tensor(1.0)
+    y = mg.Tensor(2.0)
+
+    z = x * y
+    h = mg.add(z, 2, constant=True)
+    f = x * h
+
+    order = f._topological_sort()
+    assert [node.creator for node in order] == [f.creator]
+
+    f.backward()
+    assert_array_equal(x.grad, 4.0)
+    assert h.grad is None and z.grad is None and y.grad is None
+
+
+def test_graph_is_not_stored_per_op():
+    """Ensures that operations do not each hold a copy of their ancestry"""
+    x = mg.Tensor(1.0)
+    f = x
+    for _ in range(10):
+        f = f * 2
+
+    assert "graph" not in vars(f.creator)
+    assert len(f.creator.graph) == 10
@@ -1,3 +1,5 @@
+import weakref
+
 import hypothesis.extra.numpy as hnp
 import hypothesis.strategies as st
 import numpy as np
@@ -58,6 +60,12 @@ def test_to_scalar():
         (Tensor(1), "Tensor(1)"),
         (Tensor([1]), "Tensor([1])"),
         (Tensor([1, 2]), "Tensor([1, 2])"),
+        (Tensor(1.5, dtype="float32"), "Tensor(1.5, dtype=float32)"),
+        (
+            mg.arange(30),
+            "Tensor([ 0,  1,  2,  3,  4,  5,  6,  7,  8,  9, 10, 11, 12, 13, 14, 15, 16,"
+            "\n        17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29])",
+        ),
         (
             mg.arange(9).reshape((3, 3)),
             "Tensor([[0, 1, 2],\n        [3, 4, 5],\n        [6, 7, 8]])",
@@ -448,3 +456,104 @@ def test_clear_graph(x, y, z):
 
     with raises(InvalidBackprop):
         g.backward()
+
+
+def test_ones_seed_is_not_allocated():
+    x = Tensor(np.arange(12.0).reshape(3, 4))
+    f = 2 * x
+    f.backward()
+    assert not f.grad.flags.writeable
+    assert f.grad.strides == (0, 0)
+    assert_array_equal(f.grad, np.ones_like(x.data))
+    assert_array_equal(x.grad, np.full_like(x.data, 2.0))
+
+
+def test_accumulate_into_ones_seed():
+    x = Tensor([1.0, 2.0, 3.0])
+    f = 2 * x
+    f.backward()
+
+    # `f` receives a gradient on top of its (read-only) seed
+    g = (3 * f).sum()
+    g.backward()
+    assert_array_equal(f.grad, [4.0, 4.0, 4.0])
+
+    f.backward()
+    assert_array_equal(f.grad, [1.0, 1.0, 1.0])
+
+
+def test_accumulate_into_0d_seed_yields_array():
+    x = Tensor(2.0)
+    f = 2 * x
+    f.backward()
+
+    (3 * f).backward()
+    assert isinstance(f.grad, np.ndarray)
+    assert f.grad.flags.writeable
+    assert_array_equal(f.grad, 4.0)
+
+
+@pytest.mark.parametrize("as_tensor", [True, False])
+def test_backward_does_not_mutate_provided_grad(as_tensor: bool):
+    grad = np.array([1.0, 2.0])
+    x = Tensor([3.0, 4.0])
+    f = 2 * x
+    f.backward(Tensor(grad) if as_tensor else grad)
+
+    # accumulate into `f.grad` via a separate graph
+    (3 * f).backward(np.array([1.0, 1.0]))
+    assert_array_equal(f.grad, [4.0, 5.0])
+    assert_array_equal(grad, [1.0, 2.0])
+
+
+def test_backward_with_array_subclass_grad():
+    x = Tensor([[1.0, 2.0], [3.0, 4.0]])
+    y = Tensor([[1.0, 0.0], [0.0, 1.0]])
+    f = x * y
+    f.backward(np.matrix([[1.0, 2.0], [3.0, 4.0]]))
+
+    assert type(f.grad) is np.ndarray
+    assert type(x.grad) is np.ndarray
+    assert_array_equal(x.grad, [[1.0, 0.0], [0.0, 4.0]])
+    assert_array_equal(y.grad, [[1.0, 4.0], [9.0, 16.0]])
+
+
+def test_tensors_hash_by_identity():
+    x = Tensor([1.0, 2.0])
+    y = Tensor([1.0, 2.0])
+    assert hash(x) == hash(x)
+    assert len({x, y, x}) == 2
+    assert {x: 1, y: 2}[y] == 2
+
+
+def test_tensor_has_no_instance_dict():
+    """Ensures that tensors store their attributes in slots"""
+    x = Tensor([1.0, 2.0])
+    assert not hasattr(x, "__dict__")
+    with raises(AttributeError):
+        x.foo = 1
+
+
+def test_tensor_supports_weakref():
+    x = Tensor(1.0)
+    ref = weakref.ref(x)
+    assert ref() is x
+
+    del x
+    assert ref() is None
+
+
+def test_tensor_subclass_is_treated_as_tensor():
+    class MyTensor(Tensor):
+        pass
+
+    x = MyTensor([1.0, 2.0])
+    y = Tensor([2.0, 0.0])
+    assert Tensor(x).data is x.data
+    assert_array_equal(x < y, [True, False])
+    assert_array_equal(y > x, [True, False])
+
+    z = y * x
+    z.backward(MyTensor([1.0, 1.0]))
+    assert_array_equal(x.grad, y.data)
+    assert_array_equal(y.grad, x.data)
@@ -42,3 +42,40 @@ def test_seq_mult():
     assert_allclose(a.grad, a1.grad)
     assert_allclose(b.grad, b1.grad)
     assert_allclose(c.grad, c1.grad)
+
+
+def test_seq_add_promotes_and_broadcasts():
+    """ operands that upcast or broadcast the running sum must not be
+        accumulated in-place"""
+    a = Tensor([1, 2, 3])
+    b = Tensor(2)
+    c = Tensor([[0.5], [1.5]])
+    d = Tensor([1.0, 1.0, 1.0])
+    f = add_sequence(a, b, c, d)
+    assert_allclose(f.data, a.data + b.data + c.data + d.data)
+
+
+def test_seq_mult_with_zero():
+    a = Tensor([0.0, 2.0])
+    b = Tensor([1.0, 3.0])
+    c = Tensor(2.0)
+    f = multiply_sequence(a, b, c)
+    f.sum().backward()
+
+    assert_allclose(f.data, [0.0, 12.0])
+    assert_allclose(a.grad, [2.0, 6.0])
+    assert_allclose(b.grad, [0.0, 4.0])
+    assert_allclose(c.grad, 6.0)
+
+
+def test_seq_mult_bkwd_ignores_writes_to_output():
+    a = Tensor([1.0, 2.0])
+    b = Tensor([3.0, 4.0])
+    c = Tensor([5.0, 6.0])
+    f = multiply_sequence(a, b, c)
+    f.data[...] = 0
+    f.sum().backward()
+
+    assert_allclose(a.grad, [15.0, 24.0])
+    assert_allclose(b.grad, [5.0, 12.0])
+    assert_allclose(c.grad, [3.0, 8.0])
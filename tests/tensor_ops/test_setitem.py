@@ -90,10 +90,10 @@ def test_setitem_multiple_input():
     assert_array_equal(y.grad, np.array([3.0]))
 
     f.null_gradients()
-    assert x.grad is None and not x._ops and not x._accum_ops
-    assert y.grad is None and not y._ops and not y._accum_ops
-    assert o.grad is None and not o._ops and not o._accum_ops
-    assert f.grad is None and not f._ops and not f._accum_ops
+    assert x.grad is None and not x._ops
+    assert y.grad is None and not y._ops
+    assert o.grad is None and not o._ops
+    assert f.grad is None and not f._ops
 
 
 @given(x_constant=st.booleans(), y_constant=st.booleans(), data=st.data())
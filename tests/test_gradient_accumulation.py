@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+from mygrad.gradient_accumulation import GradientAccumulator
+
+
+@pytest.mark.parametrize("accum_steps", [0, -1, 1.0, True])
+def test_invalid_accum_steps_raises(accum_steps):
+    with pytest.raises(ValueError):
+        GradientAccumulator(accum_steps)
+
+
+def test_accumulated_grad_matches_full_batch():
+    x = np.arange(12.0).reshape(6, 2)
+    w = mg.Tensor([0.5, -1.0])
+    c = mg.Tensor(2.0, constant=True)
+
+    mg.sum((x * w) ** 2 * c).backward()
+    expected = np.copy(w.grad)
+    w.null_gradients()
+
+    accumulator = GradientAccumulator(accum_steps=3)
+    ready = [
+        accumulator.step(mg.sum((x_batch * w) ** 2 * c)) for x_batch in np.split(x, 3)
+    ]
+    assert ready == [False, False, True]
+    assert accumulator.leaves == [w]
+    assert_allclose(w.grad, expected)
+
+
+def test_step_clears_graph():
+    w = mg.Tensor([1.0, 2.0])
+    h = w * 2
+    loss = mg.sum(h)
+
+    GradientAccumulator(accum_steps=1).step(loss)
+    assert loss.creator is None and h.creator is None
+    assert not w._ops
+
+
+def test_null_gradients_restarts_accumulation():
+    w = mg.Tensor([1.0, 2.0])
+    accumulator = GradientAccumulator(accum_steps=2)
+    accumulator.step(mg.sum(w))
+    accumulator.null_gradients()
+
+    assert w.grad is None and accumulator.count == 0
+    assert not accumulator.step(mg.sum(3 * w))
+    assert_allclose(w.grad, [3.0, 3.0])
+
+
+def test_leaf_loss_accumulates():
+    w = mg.Tensor([1.0, 2.0])
+    accumulator = GradientAccumulator(accum_steps=2)
+    assert not accumulator.step(w)
+    assert accumulator.step(w)
+    assert accumulator.leaves == [w]
+    assert_allclose(w.grad, [2.0, 2.0])
+
+
+def test_constant_leaf_loss_is_not_tracked():
+    c = mg.Tensor(1.0, constant=True)
+    accumulator = GradientAccumulator(accum_steps=1)
+    assert accumulator.step(c)
+    assert accumulator.leaves == [] and c.grad is None
+
+
+def test_constant_loss_is_not_tracked():
+    w = mg.Tensor([1.0, 2.0])
+    accumulator = GradientAccumulator(accum_steps=1)
+    assert accumulator.step(mg.sum(w * 2, constant=True))
+    assert accumulator.leaves == [] and w.grad is None
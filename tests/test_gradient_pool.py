@@ -0,0 +1,98 @@
+import weakref
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+import mygrad as mg
+from mygrad import gradient_pool
+from mygrad.gradient_pool import GradientPool
+
+
+def test_pool_is_opt_in():
+    assert gradient_pool._active_pool is None
+    x = mg.Tensor([1.0, 2.0, 3.0])
+    (x + 0).backward()
+    grad = weakref.ref(x.grad)
+    x.null_gradients()
+    assert grad() is None
+
+
+def test_context_activates_and_clears_pool():
+    with GradientPool() as pool:
+        assert gradient_pool._active_pool is pool
+        with GradientPool() as inner:
+            assert gradient_pool._active_pool is inner
+        assert gradient_pool._active_pool is pool
+        pool.put(pool.get((2,), np.dtype(float)))
+        assert pool.nbytes == 16
+
+    assert gradient_pool._active_pool is None
+    assert pool.nbytes == 0
+
+
+def test_pool_reuses_the_buffers_that_it_issued():
+    pool = GradientPool()
+    x = pool.get((2, 3), np.dtype(float))
+    assert pool.put(x)
+    assert not pool.put(x)  # already returned
+    assert pool.get((2, 3), np.dtype(float)) is x
+    assert pool.get((2, 3), np.dtype(float)) is not x
+    assert (pool.hits, pool.misses) == (1, 2)
+
+
+def test_pool_rejects_foreign_buffers():
+    pool = GradientPool()
+    assert not pool.put(np.empty((2, 3)))
+    assert pool.nbytes == 0
+
+
+def test_pool_is_bounded_per_key():
+    pool = GradientPool(max_per_key=2)
+    buffers = [pool.get((3,), np.dtype(float)) for _ in range(3)]
+    assert [pool.put(b) for b in buffers] == [True, True, False]
+
+
+def test_pool_is_bounded_by_bytes_and_evicts_lru():
+    pool = GradientPool(max_bytes=64)
+    a, b, c = (pool.get((2,), np.dtype(float)) for _ in range(3))  # 16 bytes each
+    d = pool.get((4,), np.dtype(float))  # 32 bytes
+    big = pool.get((16,), np.dtype(float))  # 128 bytes
+
+    assert not pool.put(big)
+    assert pool.put(a) and pool.put(b)
+    assert pool.put(d)
+    assert pool.nbytes == 64
+
+    # shape-(2,) was used most recently, so shape-(4,) is evicted
+    assert pool.get((2,), np.dtype(float)) is b
+    assert pool.put(b)
+    assert pool.put(c)
+    assert pool.nbytes == 48
+    assert pool.get((4,), np.dtype(float)) is not d
+
+
+def test_null_gradients_recycles_pooled_grad():
+    x = mg.Tensor([1.0, 2.0, 3.0])
+    with GradientPool() as pool:
+        (x + 0).backward()
+        grad = weakref.ref(x.grad)
+        x.null_gradients()
+        assert grad() is not None  # retained by the pool
+
+        (x + 0).backward()
+        assert x.grad is grad()
+        assert_array_equal(x.grad, np.ones(3))
+        assert (pool.hits, pool.misses) == (1, 1)
+
+
+def test_null_gradients_does_not_recycle_unpooled_grad():
+    x = mg.Tensor([1.0, 2.0, 3.0])
+    with GradientPool() as pool:
+        (3 * x).backward()  # `x.grad` is allocated by `Multiply`
+        grad = x.grad
+        x.null_gradients()
+
+        (x + 0).backward()
+        assert x.grad is not grad
+        assert_array_equal(grad, [3.0, 3.0, 3.0])
+        assert pool.hits == 0